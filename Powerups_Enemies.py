@@ -186,17 +186,40 @@ class EnemyContext:
     velocidad y estado de vida, mientras referencia al Flyweight para los graficos.
     """
     
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'padding_x', 'padding_top', 'rect',
+        'velocity_x', 'velocity_y', 'gravity', 'on_ground',
+        'alive', 'death_timer', 'death_duration',
+        'direction_changes', 'direction_change_timer', 'ignore_spikes_timer',
+        'current_sprite_index', 'animation_counter', 'animation_speed',
+        'sprite_sequence', 'sequence_index', 'facing_right',
+        '_sprite_flyweight',
+    )
+    
     def __init__(self, x: int, y: int, width: int = 40, height: int = 50):
+        # Parametros fijos, iguales para todos los enemigos
+        self.padding_x = 6
+        self.padding_top = 12
+        self.gravity = 0.8
+        self.death_duration = 120
+        self.animation_speed = 10
+        self.sprite_sequence = [0, 1, 2, 1]
+        
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, width, height)
+    
+    def reset(self, x: int, y: int, width: int = 40, height: int = 50):
+        """
+        Reinicia todo el estado extrinseco en el lugar.
+        Permite reutilizar la instancia desde un EntityPool al recargar niveles.
+        """
         # Estado extrinseco (propio de esta instancia)
         self.x = x
         self.y = y
         self.width = width
         self.height = height
         
-        self.padding_x = 6
-        self.padding_top = 12
-        
-        self.rect = pygame.Rect(
+        self.rect.update(
             self.x + self.padding_x,
             self.y + self.padding_top,
             self.width - 2 * self.padding_x,
@@ -205,12 +228,10 @@ class EnemyContext:
         
         self.velocity_x = -2
         self.velocity_y = 0
-        self.gravity = 0.8
         self.on_ground = False
         
         self.alive = True
         self.death_timer = 0
-        self.death_duration = 120
         
         self.direction_changes = 0
         self.direction_change_timer = 0
@@ -218,8 +239,6 @@ class EnemyContext:
         
         self.current_sprite_index = 0
         self.animation_counter = 0
-        self.animation_speed = 10
-        self.sprite_sequence = [0, 1, 2, 1]
         self.sequence_index = 0
         self.facing_right = False
         
@@ -309,21 +328,16 @@ class EnemyContext:
         
         self.on_ground = False
         
-        for platform in platforms:
-            platform_rect = pygame.Rect(
-                platform['x'], platform['y'],
-                platform['width'], platform['height']
-            )
-            
+        for platform_rect in platforms:
             if self.rect.colliderect(platform_rect):
                 if self.velocity_y > 0:
-                    self.y = platform['y'] - self.height
+                    self.y = platform_rect.y - self.height
                     self.velocity_y = 0
                     self.on_ground = True
                     self.rect.x = self.x + self.padding_x
                     self.rect.y = self.y + self.padding_top
                 elif self.velocity_y < 0:
-                    self.y = platform['y'] + platform['height']
+                    self.y = platform_rect.bottom
                     self.velocity_y = 0
                     self.rect.x = self.x + self.padding_x
                     self.rect.y = self.y + self.padding_top
@@ -388,8 +402,18 @@ class PowerUpContext:
     definir el comportamiento del efecto cuando es recolectado.
     """
     
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'powerup_type', 'collected',
+        '_strategy', '_sprite_flyweight',
+    )
+    
     def __init__(self, x: int, y: int, powerup_type: str, 
                  width: int = 40, height: int = 50):
+        self.reset(x, y, powerup_type, width, height)
+    
+    def reset(self, x: int, y: int, powerup_type: str,
+              width: int = 40, height: int = 50):
+        """Reinicia el PowerUp en el lugar (reutilizacion desde EntityPool)."""
         self.x = x
         self.y = y
         self.width = width
@@ -53,3 +53,6 @@ class GameConfig:
     DEFAULT_WORLD_WIDTH = 3000
     FPS = 60
     WINDOW_TITLE = "Super Kirby Bro - Proyecto Final"
+    # Distancia por delante de la camara a la que se instancian enemigos y
+    # PowerUps pendientes
+    ENTITY_ACTIVATION_MARGIN = 400
@@ -0,0 +1,79 @@
+"""
+Objetos de Transferencia de Datos (DTOs).
+Registros inmutables que produce WorldGenerator y consume WorldLoader.
+Usan __slots__ (sin __dict__ por instancia) y se leen por atributo, en lugar
+de diccionarios con claves de texto.
+No tienen valores por defecto: el generador escribe siempre todos los campos,
+asi el cargador nunca tiene que resolverlos.
+Checkpoints, meta y suelo dependen solo de las dimensiones del mundo, asi que
+el generador puede cachearlos y compartirlos entre niveles.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Union
+
+
+@dataclass(slots=True, frozen=True)
+class PlatformDTO:
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+@dataclass(slots=True, frozen=True)
+class SpikeDTO:
+    x: int
+    y: int
+    width: int
+    height: int
+    on_platform: bool
+
+
+@dataclass(slots=True, frozen=True)
+class CheckpointDTO:
+    x: int
+    y: int
+
+
+@dataclass(slots=True, frozen=True)
+class GoalDTO:
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+@dataclass(slots=True, frozen=True)
+class EnemyDTO:
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+@dataclass(slots=True, frozen=True)
+class PowerUpDTO:
+    x: int
+    y: int
+    type: str
+    width: int
+    height: int
+
+
+# Cualquier DTO con caja (x, y, width, height)
+BoxDTO = Union[PlatformDTO, SpikeDTO, EnemyDTO, PowerUpDTO]
+
+
+@dataclass(slots=True, frozen=True)
+class WorldData:
+    """Resultado de WorldGenerator.generate_world, listo para WorldLoader"""
+    platforms: List[PlatformDTO]
+    spikes: List[SpikeDTO]
+    checkpoints: List[CheckpointDTO]
+    powerups: List[PowerUpDTO]
+    enemies: List[EnemyDTO]
+    goal: GoalDTO
+    colors: Dict[str, Tuple[int, int, int]]
+    name: str
+    music: str
@@ -4,6 +4,8 @@ Define las clases core para los objetos interactivos del juego (Jugador,
 Plataformas, Trampas, etc).
 Implementacion de patrones:
 - Memento: La clase Player actua como Originator, capaz de guardar y restaurar su estado.
+- Flyweight: Plataformas y espinas de igual tamano y color comparten la misma
+  superficie pre-renderizada.
 """
 
 import pygame
@@ -11,6 +13,53 @@ from config import PlayerConfig
 from memento import PlayerMemento
 
 
+# ============================================================================
+# FLYWEIGHT DE SUPERFICIES
+# ============================================================================
+
+# Superficies compartidas, clave (tipo, ancho, alto, color)
+_SURFACE_CACHE = {}
+
+# Margen alrededor del triangulo de la espina: el borde de 2px puede salirse
+# de la caja (x, y, width, height)
+SPIKE_SURFACE_PADDING = 2
+
+
+def _get_platform_surface(width, height, color):
+    """Retorna la superficie compartida de una plataforma (relleno y borde)."""
+    key = ('platform', width, height, color)
+    surface = _SURFACE_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface((width, height))
+        pygame.draw.rect(surface, color, (0, 0, width, height))
+        # Borde para efecto 3D
+        pygame.draw.rect(surface,
+                    tuple(max(0, c - 30) for c in color),
+                    (0, 0, width, height), 3)
+        _SURFACE_CACHE[key] = surface
+    return surface
+
+
+def _get_spike_surface(width, height, color):
+    """Retorna la superficie compartida (con transparencia) de una espina."""
+    key = ('spike', width, height, color)
+    surface = _SURFACE_CACHE.get(key)
+    if surface is None:
+        pad = SPIKE_SURFACE_PADDING
+        surface = pygame.Surface(
+            (width + 2 * pad + 1, height + 2 * pad + 1), pygame.SRCALPHA
+        )
+        points = [
+            (pad + width // 2, pad),
+            (pad, pad + height),
+            (pad + width, pad + height)
+        ]
+        pygame.draw.polygon(surface, color, points)
+        pygame.draw.polygon(surface, (0, 0, 0), points, 2)
+        _SURFACE_CACHE[key] = surface
+    return surface
+
+
 class Player:
     """
     Clase Player (Originator):
@@ -110,20 +159,19 @@ class Player:
         self.on_ground = False
         player_rect = self.get_rect()
         
-        for platform in platforms:
-            platform_rect = pygame.Rect(platform['x'], platform['y'], 
-                                       platform['width'], platform['height'])
-            
-            if player_rect.colliderect(platform_rect):
-                # Colision desde arriba (aterrizar)
-                if self.velocity_y > 0:
-                    self.y = platform['y'] - self.height
-                    self.velocity_y = 0
-                    self.on_ground = True
-                # Colision desde abajo
-                elif self.velocity_y < 0:
-                    self.y = platform['y'] + platform['height']
-                    self.velocity_y = 0
+        # collidelistall recorre todas las plataformas en C y devuelve los
+        # indices que chocan, en el mismo orden que la lista
+        for index in player_rect.collidelistall(platforms):
+            platform_rect = platforms[index]
+            # Colision desde arriba (aterrizar)
+            if self.velocity_y > 0:
+                self.y = platform_rect.y - self.height
+                self.velocity_y = 0
+                self.on_ground = True
+            # Colision desde abajo
+            elif self.velocity_y < 0:
+                self.y = platform_rect.bottom
+                self.velocity_y = 0
 
         # Actualizar animacion
         if self.sprites:
@@ -228,46 +276,46 @@ class Player:
 class Platform:
     """Clase para las plataformas"""
     
+    __slots__ = ('x', 'y', 'width', 'height', 'color', 'image')
+    
     def __init__(self, x, y, width, height, color):
+        self.reset(x, y, width, height, color)
+    
+    def reset(self, x, y, width, height, color):
+        """Reinicia la plataforma en el lugar (reutilizacion desde EntityPool)"""
         self.x = x
         self.y = y
         self.width = width
         self.height = height
         self.color = color
+        self.image = _get_platform_surface(width, height, color)
     
     def draw(self, screen, camera_x):
         """Dibuja la plataforma"""
-        screen_x = self.x - camera_x
-        pygame.draw.rect(screen, self.color,
-                    (screen_x, self.y, self.width, self.height))
-        # Borde para efecto 3D
-        pygame.draw.rect(screen,
-                    tuple(max(0, c - 30) for c in self.color),
-                    (screen_x, self.y, self.width, self.height), 3)
+        screen.blit(self.image, (self.x - camera_x, self.y))
 
 
 class Spike:
     """Clase para las espinas/trampas"""
     
+    __slots__ = ('x', 'y', 'width', 'height', 'color', 'image')
+    
     def __init__(self, x, y, width, height, color):
+        self.reset(x, y, width, height, color)
+    
+    def reset(self, x, y, width, height, color):
+        """Reinicia la espina en el lugar (reutilizacion desde EntityPool)"""
         self.x = x
         self.y = y
         self.width = width
         self.height = height
         self.color = color
+        self.image = _get_spike_surface(width, height, color)
     
     def draw(self, screen, camera_x):
         """Dibuja la espina como un triangulo"""
-        screen_x = self.x - camera_x
-        
-        points = [
-            (screen_x + self.width // 2, self.y),
-            (screen_x, self.y + self.height),
-            (screen_x + self.width, self.y + self.height)
-        ]
-        
-        pygame.draw.polygon(screen, self.color, points)
-        pygame.draw.polygon(screen, (0, 0, 0), points, 2)
+        pad = SPIKE_SURFACE_PADDING
+        screen.blit(self.image, (self.x - camera_x - pad, self.y - pad))
     
     def get_rect(self):
         """Retorna el rectangulo de colision (solo parte superior del triangulo)"""
@@ -279,6 +327,10 @@ class Spike:
 class Checkpoint:
     """Clase para los checkpoints"""
     
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'checkpoint_id', 'activated', 'color',
+    )
+    
     def __init__(self, x, y, checkpoint_id):
         self.x = x
         self.y = y
@@ -318,6 +370,11 @@ class Checkpoint:
 class Goal:
     """Clase para la meta del nivel"""
     
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'reached',
+        'base_color', 'pole_color', 'ball_color',
+    )
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -0,0 +1,42 @@
+"""
+Patron de Diseno Object Pool:
+Conserva las entidades de un nivel descargado para reutilizarlas en la
+siguiente carga, en lugar de descartarlas y crear instancias nuevas.
+Las clases administradas exponen un metodo reset() con la misma firma que
+su constructor, que reescribe todo su estado en el lugar.
+"""
+
+from typing import Callable, Generic, Iterable, List, TypeVar
+
+T = TypeVar('T')
+
+
+class EntityPool(Generic[T]):
+    """
+    Pool de instancias de una clase de entidad.
+    Entrega instancias liberadas (reiniciadas con reset) y solo llama a la
+    factoria cuando el pool esta vacio.
+    """
+
+    def __init__(self, factory: Callable[..., T]):
+        """
+        Args:
+            factory: Clase (o callable) que crea una instancia nueva.
+        """
+        self._factory = factory
+        self._free: List[T] = []
+
+    def acquire(self, *args) -> T:
+        """Obtiene una instancia inicializada con los argumentos dados."""
+        if self._free:
+            entity = self._free.pop()
+            entity.reset(*args)
+            return entity
+        return self._factory(*args)
+
+    def release_all(self, entities: Iterable[T]):
+        """Devuelve al pool las instancias que ya no se usan."""
+        self._free.extend(entities)
+
+    def __len__(self) -> int:
+        return len(self._free)
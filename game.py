@@ -116,6 +116,9 @@ class Game:
             play_world_music(self.world_loader.music_file)
         
         self.player = Player(100, 100)
+        # La camara parte desde el jugador nuevo y no desde el mundo anterior:
+        # de ella depende que enemigos y PowerUps se instancian
+        self.camera.update(self.player.x, self.player.width)
         self.checkpoint_manager.clear_checkpoints()
         
         event = GameEvent(
@@ -197,6 +200,12 @@ class Game:
         if self.menu_manager.current_state != GameState.PLAYING:
             return
         
+        # Instanciar enemigos y PowerUps que entran en el rango de la camara
+        self.world_loader.activate_entities(
+            self.camera.get_x() + self.width
+            + GameConfig.ENTITY_ACTIVATION_MARGIN
+        )
+        
         platform_data = self.world_loader.get_platform_data()
         self.player.update(platform_data, self.world_width)
         
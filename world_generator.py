@@ -19,9 +19,24 @@ disponibles en el sistema, permitiendo validacion y extensibilidad.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import List, Dict, Tuple, Optional, Mapping
+import bisect
 import random
 
+from dtos import (
+    PlatformDTO, SpikeDTO, CheckpointDTO, GoalDTO, EnemyDTO, PowerUpDTO,
+    BoxDTO, WorldData
+)
+
+
+# Candidato de espina durante la generacion: (x, y, on_platform).
+# El tamano de las espinas es constante por mundo (HazardConfig), asi que no
+# se guarda en cada candidato.
+SpikeCandidate = Tuple[int, int, bool]
+
 
 # ============================================================================
 # CONSTANTES GLOBALES
@@ -42,6 +57,15 @@ class WorldConstants:
     MIN_VERTICAL_SPACING = 80
     MIN_HORIZONTAL_SPACING = 100
     
+    # Celdas candidatas para colocar plataformas
+    PLATFORM_SLOT_WIDTH = 80
+    PLATFORM_SLOT_HEIGHT = 60
+    PLATFORM_SLOT_ATTEMPTS = 4
+    
+    # Tasa de aceptacion de plataformas (media movil entre segmentos)
+    PLATFORM_ACCEPT_EMA_INITIAL = 0.3
+    PLATFORM_ACCEPT_EMA_ALPHA = 0.2
+    
     # Enemigos
     ENEMY_SPAWN_CHANCE = 0.8
     ENEMY_SPAWN_CHANCE_GROUND = 0.8
@@ -67,10 +91,10 @@ class WorldConstants:
 # CONFIGURACIONES POR TIPO DE MUNDO
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlatformConfig:
     """Configuración para generación de plataformas"""
-    starting_platforms: List[Dict[str, int]]
+    starting_platforms: Tuple[Mapping[str, int], ...]
     num_segments: int
     platforms_per_segment: Tuple[int, int]  # (min, max)
     height_range: Tuple[int, int]  # (min, max) altura desde suelo
@@ -83,7 +107,7 @@ class PlatformConfig:
     generation_end_offset: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HazardConfig:
     """Configuración para generación de hazards/espinas"""
     safe_zone: int
@@ -97,17 +121,17 @@ class HazardConfig:
     spike_height: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PowerUpConfig:
     """Configuración para distribución de PowerUps"""
-    probabilities: Dict[str, float]
+    probabilities: Mapping[str, float]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorldConfig:
     """Configuración completa de un mundo"""
     name: str
-    colors: Dict[str, Tuple[int, int, int]]
+    colors: Mapping[str, Tuple[int, int, int]]
     platform_config: PlatformConfig
     hazard_config: HazardConfig
     powerup_config: PowerUpConfig
@@ -124,31 +148,62 @@ class GeometryValidator:
     @staticmethod
     def rectangles_overlap(x1: int, y1: int, w1: int, h1: int,
                           x2: int, y2: int, w2: int, h2: int) -> bool:
-        """Verifica si dos rectángulos se superponen"""
-        return not (x1 + w1 < x2 or x2 + w2 < x1 or y1 + h1 < y2 or y2 + h2 < y1)
+        """
+        Verifica si dos rectángulos se superponen.
+        Usa '&' en lugar de 'or'/'and' para evaluar las cuatro comparaciones
+        sin saltos condicionales.
+        """
+        a = x1 + w1 - x2
+        b = x2 + w2 - x1
+        c = y1 + h1 - y2
+        d = y2 + h2 - y1
+        return (a >= 0) & (b >= 0) & (c >= 0) & (d >= 0)
     
     @staticmethod
-    def calculate_distance(x1: int, y1: int, x2: int, y2: int) -> float:
-        """Calcula distancia euclidiana entre dos puntos"""
-        return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+    def calculate_distance_squared(x1: int, y1: int, x2: int, y2: int) -> int:
+        """
+        Calcula la distancia euclidiana al cuadrado entre dos puntos.
+        Para comparar contra un radio basta con comparar contra radio**2,
+        evitando la raiz cuadrada.
+        """
+        dx = x1 - x2
+        dy = y1 - y2
+        return dx * dx + dy * dy
 
 
 class CheckpointValidator:
     """Validaciones relacionadas con checkpoints"""
     
-    def __init__(self, checkpoints: List[Dict], radius: int = None):
+    def __init__(self, checkpoints: List[CheckpointDTO], radius: int = None):
         self.checkpoints = checkpoints
         self.default_radius = radius or WorldConstants.CHECKPOINT_SAFE_RADIUS
+        # Los checkpoints son fijos por mundo: se extraen sus coordenadas una
+        # vez, ordenadas por 'x' para acotar las busquedas con bisect
+        self.points = sorted((cp.x, cp.y) for cp in checkpoints)
+        self._xs = [cp_x for cp_x, _ in self.points]
+    
+    def _points_in_x_range(self, x: int, max_dx: int) -> List[Tuple[int, int]]:
+        """Checkpoints con |cp_x - x| < max_dx"""
+        lo = bisect.bisect_right(self._xs, x - max_dx)
+        hi = bisect.bisect_left(self._xs, x + max_dx)
+        return self.points[lo:hi]
     
     def is_near_checkpoint(self, x: int, y: int, radius: int = None) -> bool:
         """Verifica si una posición está cerca de algún checkpoint"""
         radius = radius or self.default_radius
+        radius_squared = radius * radius
         
-        for checkpoint in self.checkpoints:
-            distance = GeometryValidator.calculate_distance(
-                x, y, checkpoint['x'], checkpoint['y']
-            )
-            if distance < radius:
+        for cp_x, cp_y in self._points_in_x_range(x, radius):
+            dx = x - cp_x
+            dy = y - cp_y
+            if dx * dx + dy * dy < radius_squared:
+                return True
+        return False
+    
+    def is_within_box(self, x: int, y: int, max_dx: int, max_dy: int) -> bool:
+        """Verifica si algún checkpoint cumple |dx| < max_dx y |dy| < max_dy"""
+        for _, cp_y in self._points_in_x_range(x, max_dx):
+            if abs(y - cp_y) < max_dy:
                 return True
         return False
 
@@ -174,25 +229,92 @@ class PhysicsValidator:
         
         return True
     
+    @staticmethod
+    def build_surface_index(platforms: List[PlatformDTO]) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Indexa los rangos horizontales (x_inicio, x_fin) de las plataformas
+        por la coordenada 'y' de su superficie superior.
+        """
+        surfaces = {}
+        for platform in platforms:
+            surfaces.setdefault(platform.y, []).append(
+                (platform.x, platform.x + platform.width)
+            )
+        return surfaces
+    
     @staticmethod
     def is_on_surface(spike_x: int, spike_y: int, spike_height: int,
-                     platforms: List[Dict], ground_y: int) -> bool:
-        """Verifica si una espina está sobre una superficie (suelo o plataforma)"""
+                     surfaces: Dict[int, List[Tuple[int, int]]],
+                     ground_y: int) -> bool:
+        """
+        Verifica si una espina está sobre una superficie (suelo o plataforma).
+        Las espinas se colocan alineadas exactamente con la superficie, por lo
+        que basta buscar su base en el indice de build_surface_index.
+        """
         spike_bottom = spike_y + spike_height
         
         # Verificar si está en el suelo
-        if abs(spike_bottom - ground_y) < 5:
+        if spike_bottom == ground_y:
             return True
         
-        # Verificar si está sobre alguna plataforma
-        for platform in platforms:
-            if abs(spike_bottom - platform['y']) < 5:
-                if spike_x >= platform['x'] and spike_x <= platform['x'] + platform['width']:
-                    return True
+        # Verificar si está sobre alguna plataforma a esa altura
+        for x_start, x_end in surfaces.get(spike_bottom, ()):
+            if x_start <= spike_x <= x_end:
+                return True
         
         return False
 
 
+class SpatialHashGrid:
+    """
+    Indice espacial por celdas de tamano fijo para las validaciones de
+    colocacion. Cada elemento se registra en todas las celdas que cubre su
+    AABB y las consultas solo revisan las celdas que toca el area pedida,
+    en lugar de recorrer todos los objetos existentes.
+    Para restricciones que solo dependen de 'x' basta una lista ordenada
+    (ver WorldGenerator._has_x_within).
+    """
+    
+    # Por debajo de este tamano recorrer la lista completa es mas barato
+    BRUTE_FORCE_LIMIT = 32
+    
+    def __init__(self, cell_width: int = 200, cell_height: int = 200):
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self._cells = {}
+        self._items = []
+    
+    def insert(self, item, x: int, y: int, width: int, height: int):
+        """Registra un elemento con su AABB"""
+        self._items.append(item)
+        for key in self._cell_keys(x, y, x + width, y + height):
+            self._cells.setdefault(key, []).append(item)
+    
+    def query(self, x: int, y: int, width: int, height: int,
+              pad_x: int = 0, pad_y: int = 0) -> List:
+        """
+        Retorna los elementos cuyas celdas tocan el area (x, y, width, height)
+        ampliada por pad_x/pad_y. Puede incluir elementos de mas (el llamador
+        hace la comprobacion exacta), pero nunca omite uno que la toque.
+        """
+        # Siempre una lista nueva: el llamador no puede alterar el indice
+        if len(self._items) < self.BRUTE_FORCE_LIMIT:
+            return list(self._items)
+        
+        found = {}
+        for key in self._cell_keys(x - pad_x, y - pad_y,
+                                   x + width + pad_x, y + height + pad_y):
+            for item in self._cells.get(key, ()):
+                found[id(item)] = item
+        return list(found.values())
+    
+    def _cell_keys(self, x0: int, y0: int, x1: int, y1: int) -> List[Tuple[int, int]]:
+        """Celdas cubiertas por el rectangulo [x0, x1] x [y0, y1]"""
+        columns = range(int(x0 // self.cell_width), int(x1 // self.cell_width) + 1)
+        rows = range(int(y0 // self.cell_height), int(y1 // self.cell_height) + 1)
+        return [(column, row) for column in columns for row in rows]
+
+
 class CollisionValidator:
     """Validaciones de colisión para colocación de objetos"""
     
@@ -201,7 +323,7 @@ class CollisionValidator:
         self.checkpoint_validator = checkpoint_validator
     
     def validate_position(self, x: int, y: int, width: int, height: int,
-                         existing_objects: List[Dict],
+                         existing_objects: List[BoxDTO],
                          min_spacing: int = None) -> bool:
         """
         Validación unificada de posición para cualquier objeto
@@ -217,17 +339,18 @@ class CollisionValidator:
         for obj in existing_objects:
             if self.geometry.rectangles_overlap(
                 x, y, width, height,
-                obj['x'], obj['y'], obj['width'], obj['height']
+                obj.x, obj.y, obj.width, obj.height
             ):
                 return False
         
         # 3. Verificar espaciado mínimo si se especifica
         if min_spacing:
+            min_spacing_squared = min_spacing * min_spacing
             for obj in existing_objects:
-                distance = GeometryValidator.calculate_distance(
-                    x, y, obj['x'], obj['y']
+                distance_squared = GeometryValidator.calculate_distance_squared(
+                    x, y, obj.x, obj.y
                 )
-                if distance < min_spacing:
+                if distance_squared < min_spacing_squared:
                     return False
         
         return True
@@ -279,6 +402,18 @@ class PowerUpSelector:
         Returns:
             El tipo seleccionado (ej: 'speed')
         
+        Raises:
+            ValueError: Si algún tipo no está registrado o las probabilidades no suman ~1.0
+        """
+        types, cdf = self.build_cdf(probabilities)
+        return self.sample(types, cdf)
+    
+    def build_cdf(self, probabilities: Dict[str, float]) -> Tuple[List[str], List[float]]:
+        """
+        Valida las probabilidades y retorna (tipos, distribucion acumulada).
+        Se calcula una vez por nivel; cada seleccion posterior con 'sample'
+        es una busqueda binaria sin volver a validar.
+        
         Raises:
             ValueError: Si algún tipo no está registrado o las probabilidades no suman ~1.0
         """
@@ -297,11 +432,18 @@ class PowerUpSelector:
                 f"Las probabilidades deben sumar 1.0, pero suman {total:.3f}"
             )
         
-        # Selección usando random.choices
         types = list(probabilities.keys())
-        weights = list(probabilities.values())
-        
-        return random.choices(types, weights=weights, k=1)[0]
+        cdf = list(accumulate(probabilities.values()))
+        return types, cdf
+    
+    @staticmethod
+    def sample(types: List[str], cdf: List[float]) -> str:
+        """
+        Selecciona un tipo usando la distribucion acumulada de 'build_cdf'.
+        Misma formula que random.choices, asi que consume el mismo numero
+        aleatorio y da el mismo resultado.
+        """
+        return types[bisect.bisect(cdf, random.random() * cdf[-1], 0, len(cdf) - 1)]
 
 # ============================================================================
 # GENERADORES BASE - TEMPLATE METHOD PATTERN
@@ -332,74 +474,72 @@ class WorldGenerator(ABC):
         self._powerup_registry.register('jump')
         self._powerup_registry.register('life')
     
-    def generate_world(self, width: int, height: int) -> Dict:
+    def generate_world(self, width: int, height: int) -> WorldData:
         """
         Metodo Plantilla (Template Method):
         Define la secuencia inmutable de pasos para generar un nivel.
 
         Estructura del Algoritmo:
         1. Obtener configuracion (Metodo Hook/Abstracto)
-        2. Inicializar estructuras
-        3. Generar Checkpoints
+        2. Generar Checkpoints
+        3. Inicializar validadores
         4. Generar Plataformas (usando config)
         5. Generar Peligros (usando config)
         6. Generar Meta
         7. Generar Enemigos
         8. Generar PowerUps (usando config y Registry)
-        9. Configurar Musica
+        9. Construir WorldData (incluye la musica del mundo)
         """
         # Obtener configuración del mundo específico
         config = self.get_world_config()
         
-        # Inicializar estructura de datos
-        world_data = {
-            'platforms': [],
-            'spikes': [],
-            'checkpoints': [],
-            'powerups': [],
-            'enemies': [],
-            'goal': None,
-            'colors': config.colors,
-            'name': config.name,
-            'music': None
-        }
-        
         # 1. Generar checkpoints
-        world_data['checkpoints'] = self._generate_checkpoints(width, height)
+        checkpoints = list(self._generate_checkpoints(width, height))
         
         # Inicializar validadores con checkpoints
-        self.checkpoint_validator = CheckpointValidator(world_data['checkpoints'])
+        self.checkpoint_validator = CheckpointValidator(checkpoints)
         self.collision_validator = CollisionValidator(
             self.geometry, self.checkpoint_validator
         )
         
         # 2. Generar elementos del mundo en orden
-        world_data['platforms'] = self._generate_platforms_with_config(
-            width, height, config.platform_config, world_data['checkpoints']
+        platforms = self._generate_platforms_with_config(
+            width, height, config.platform_config, checkpoints
         )
         
-        world_data['spikes'] = self._generate_hazards_with_config(
+        # Las plataformas ya no cambian: las elegibles para espinas y PowerUps
+        # se calculan una sola vez
+        spike_platform_idx = self._platforms_eligible_for_spikes(platforms)
+        powerup_platforms = self._sort_platforms_for_powerups(platforms, height)
+        
+        spikes = self._generate_hazards_with_config(
             width, height, config.hazard_config,
-            world_data['platforms'], world_data['checkpoints']
+            platforms, spike_platform_idx, checkpoints
         )
         
-        world_data['goal'] = self._generate_goal(width, height)
+        goal = self._generate_goal(width, height)
         
-        world_data['enemies'] = self._generate_enemies(
-            width, height, world_data['platforms'],
-            world_data['checkpoints'], world_data['goal']
+        enemies = self._generate_enemies(
+            width, height, platforms, checkpoints, goal
         )
         
-        world_data['powerups'] = self._generate_powerups_with_config(
+        powerups = self._generate_powerups_with_config(
             width, height, config.powerup_config,
-            world_data['platforms'], world_data['checkpoints'],
-            world_data['goal'], world_data['enemies'], world_data['spikes']
+            powerup_platforms, checkpoints, goal, enemies, spikes
         )
         
-
-        world_data['music'] = f"{WorldConstants.WORLD_MUSIC_PATH}{config.music_file}"
-        
-        return world_data
+        # 3. Construir el resultado de una vez; WorldLoader consume los DTOs
+        return WorldData(
+            platforms=platforms,
+            spikes=spikes,
+            checkpoints=checkpoints,
+            powerups=powerups,
+            enemies=enemies,
+            goal=goal,
+            colors=dict(config.colors),
+            name=config.name,
+            music=f"{WorldConstants.WORLD_MUSIC_PATH}{config.music_file}"
+        )
     
     # ========================================================================
     # MÉTODO ABSTRACTO - SUBCLASES DEBEN IMPLEMENTAR
@@ -417,24 +557,20 @@ class WorldGenerator(ABC):
     # MÉTODOS COMUNES - IMPLEMENTACIÓN BASE
     # ========================================================================
     
-    def _generate_checkpoints(self, width: int, height: int) -> List[Dict]:
-        """Genera checkpoints (implementación común)"""
-        checkpoints = []
-        for i in range(1, WorldConstants.NUMBER_OF_CHECKPOINTS_PER_LEVEL + 1):
-            checkpoints.append({
-                'x': i * WorldConstants.SPACE_BETWEEN_CHECKPOINTS,
-                'y': height - 150
-            })
-        return checkpoints
-    
-    def _generate_goal(self, width: int, height: int) -> Dict:
-        """Genera la meta al final del mundo"""
-        return {
-            'x': width - 120,
-            'y': height - 300,
-            'width': 60,
-            'height': 250
-        }
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _generate_checkpoints(width: int, height: int) -> Tuple[CheckpointDTO, ...]:
+        """Genera checkpoints (implementación común, cacheada por dimensiones)"""
+        return tuple(
+            CheckpointDTO(i * WorldConstants.SPACE_BETWEEN_CHECKPOINTS, height - 150)
+            for i in range(1, WorldConstants.NUMBER_OF_CHECKPOINTS_PER_LEVEL + 1)
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _generate_goal(width: int, height: int) -> GoalDTO:
+        """Genera la meta al final del mundo (cacheada por dimensiones)"""
+        return GoalDTO(width - 120, height - 300, 60, 250)
     
     # ========================================================================
     # GENERACIÓN DE PLATAFORMAS - REFACTORIZADO
@@ -442,7 +578,7 @@ class WorldGenerator(ABC):
     
     def _generate_platforms_with_config(self, width: int, height: int,
                                        config: PlatformConfig,
-                                       checkpoints: List[Dict]) -> List[Dict]:
+                                       checkpoints: List[CheckpointDTO]) -> List[PlatformDTO]:
         """Genera plataformas usando configuración específica"""
         platforms = []
         
@@ -454,24 +590,28 @@ class WorldGenerator(ABC):
             config.starting_platforms, checkpoints
         ))
         
-        # 3. Plataformas distribuidas
-        platforms.extend(self._create_distributed_platforms(
-            width, height, config, checkpoints, platforms
-        ))
+        # Indice espacial con las plataformas ya colocadas; guarda registros
+        # planos (x, y, right, bottom) con los bordes ya calculados
+        platform_grid = SpatialHashGrid()
+        for platform in platforms:
+            self._insert_platform_record(platform_grid, platform)
+        
+        # 3. Plataformas distribuidas (se agregan sobre la misma lista)
+        self._create_distributed_platforms(
+            width, height, config, checkpoints, platforms, platform_grid
+        )
         
         return platforms
     
-    def _create_ground(self, width: int, height: int) -> Dict:
-        """Crea el suelo principal"""
-        return {
-            'x': 0,
-            'y': height - 50,
-            'width': width,
-            'height': 50
-        }
-    
-    def _create_starting_platforms(self, starting_configs: List[Dict],
-                                   checkpoints: List[Dict]) -> List[Dict]:
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _create_ground(width: int, height: int) -> PlatformDTO:
+        """Crea el suelo principal (cacheado por dimensiones)"""
+        return PlatformDTO(0, height - 50, width, 50)
+    
+    def _create_starting_platforms(self,
+                                   starting_configs: Tuple[Mapping[str, int], ...],
+                                   checkpoints: List[CheckpointDTO]) -> List[PlatformDTO]:
         """Crea plataformas iniciales predefinidas"""
         platforms = []
         
@@ -480,113 +620,262 @@ class WorldGenerator(ABC):
             if not self.checkpoint_validator.is_near_checkpoint(
                 config['x'], config['y']
             ):
-                platforms.append(config)
+                # DTO propio: la configuracion es compartida entre niveles
+                platforms.append(PlatformDTO(
+                    config['x'], config['y'], config['width'], config['height']
+                ))
         
         return platforms
     
     def _create_distributed_platforms(self, width: int, height: int,
                                      config: PlatformConfig,
-                                     checkpoints: List[Dict],
-                                     existing_platforms: List[Dict]) -> List[Dict]:
-        """Genera plataformas distribuidas en el nivel"""
-        platforms = []
-        
+                                     checkpoints: List[CheckpointDTO],
+                                     platforms: List[PlatformDTO],
+                                     platform_grid: SpatialHashGrid):
+        """
+        Genera plataformas distribuidas en el nivel y las agrega a 'platforms',
+        que ya contiene el suelo y las iniciales. Una sola lista creciente
+        sirve para todas las validaciones, sin copias por intento.
+        """
         start = config.generation_start
         end = width - config.generation_end_offset
         generation_width = end - start
         
         segment_width = generation_width // config.num_segments
         
+        # Enlaces locales: el bucle de colocacion es el mas caliente del generador
+        randint = random.randint
+        randrange = random.randrange
+        
+        # Los rangos en 'y' y de ancho no dependen del segmento, y los margenes
+        # solo dependen del ancho del segmento, que es constante
+        y_min = height - config.height_range[1]
+        y_max = height - config.height_range[0]
+        width_min, width_max = config.width_range
+        margin_left = int(segment_width * config.margin_left_pct)
+        margin_right = int(segment_width * config.margin_right_pct)
+        
+        # Media movil de la tasa de aceptacion de los segmentos ya completados.
+        # Acota los intentos por segmento: si el mundo esta muy restringido no
+        # se agotan todas las celdas en cada segmento. Es local a cada mundo
+        # para que el resultado no dependa de los mundos generados antes.
+        accept_ema = WorldConstants.PLATFORM_ACCEPT_EMA_INITIAL
+        ema_alpha = WorldConstants.PLATFORM_ACCEPT_EMA_ALPHA
+        
         for segment in range(config.num_segments):
             segment_start = start + (segment * segment_width)
             segment_end = segment_start + segment_width
+            x_min = segment_start + margin_left
+            x_max = segment_end - margin_right
             
-            num_platforms = random.randint(*config.platforms_per_segment)
-            attempts = 0
+            num_platforms = randint(*config.platforms_per_segment)
             platforms_added = 0
+            attempts = 0
+            max_attempts = max(10, int(8 / max(accept_ema, 0.05)))
             
-            while platforms_added < num_platforms and attempts < 50:
+            # Colocacion constructiva: se sortea entre las celdas abiertas del
+            # segmento en vez de reintentar posiciones al azar por todo el
+            # segmento. Cada celda admite PLATFORM_SLOT_ATTEMPTS intentos.
+            open_slots = [
+                (slot, WorldConstants.PLATFORM_SLOT_ATTEMPTS)
+                for slot in self._build_platform_slots(
+                    x_min, x_max, y_min, y_max, platform_grid,
+                    config.horizontal_spacing
+                )
+            ]
+            
+            while (platforms_added < num_platforms and open_slots and
+                   attempts < max_attempts):
                 attempts += 1
+                slot, tries_left = open_slots.pop(randrange(len(open_slots)))
+                slot_x, slot_x_end, slot_y, slot_y_end = slot
                 
-                # Generar posición candidata
-                platform = self._generate_random_platform(
-                    segment_start, segment_end, height, config
+                # Posición candidata dentro de la celda (sorteos: x, y, ancho)
+                platform = PlatformDTO(
+                    randint(slot_x, slot_x_end),
+                    randint(slot_y, slot_y_end),
+                    randint(width_min, width_max),
+                    config.platform_height
                 )
                 
                 # Validar posición
-                all_platforms = existing_platforms + platforms
-                
                 if self._validate_platform_placement(
-                    platform, all_platforms, checkpoints, config
+                    platform, platform_grid, platforms, checkpoints, config
                 ):
                     platforms.append(platform)
+                    self._insert_platform_record(platform_grid, platform)
                     platforms_added += 1
-        
-        return platforms
+                    
+                    # Cerrar las celdas vecinas que ya no pueden cumplir el espaciado
+                    open_slots = [
+                        entry for entry in open_slots
+                        if not self._slot_blocked_by(
+                            entry[0], platform.x, platform.y,
+                            config.horizontal_spacing
+                        )
+                    ]
+                elif tries_left > 1:
+                    # Celda parcialmente valida: se devuelve con un intento menos
+                    open_slots.append((slot, tries_left - 1))
+            
+            if attempts:
+                accept_ema += ema_alpha * (platforms_added / attempts - accept_ema)
     
-    def _generate_random_platform(self, segment_start: int, segment_end: int,
-                                 height: int, config: PlatformConfig) -> Dict:
-        """Genera una plataforma con posición aleatoria"""
-        margin_left = int((segment_end - segment_start) * config.margin_left_pct)
-        margin_right = int((segment_end - segment_start) * config.margin_right_pct)
-        
-        x = random.randint(
-            segment_start + margin_left,
-            segment_end - margin_right
-        )
-        
-        y = random.randint(
-            height - config.height_range[1],
-            height - config.height_range[0]
+    def _build_platform_slots(self, x_min: int, x_max: int,
+                              y_min: int, y_max: int,
+                              platform_grid: SpatialHashGrid,
+                              horizontal_spacing: int) -> List[Tuple[int, int, int, int]]:
+        """
+        Divide el area de un segmento en celdas (x, x_fin, y, y_fin) de igual
+        tamano, de a lo sumo PLATFORM_SLOT_WIDTH x PLATFORM_SLOT_HEIGHT.
+        Se descartan de entrada las celdas que estan enteras dentro del radio
+        de un checkpoint o que no pueden cumplir el espaciado con una
+        plataforma ya colocada.
+        """
+        slot_width = WorldConstants.PLATFORM_SLOT_WIDTH
+        slot_height = WorldConstants.PLATFORM_SLOT_HEIGHT
+        radius = self.checkpoint_validator.default_radius
+        radius_squared = radius * radius
+        
+        # Plataformas que pueden bloquear alguna celda del segmento
+        blockers = platform_grid.query(
+            x_min, y_min, x_max - x_min, y_max - y_min,
+            pad_x=horizontal_spacing, pad_y=WorldConstants.MIN_VERTICAL_SPACING
         )
         
-        width = random.randint(*config.width_range)
+        slots = []
+        for slot_x, slot_x_end in self._split_range(x_min, x_max, slot_width):
+            for slot_y, slot_y_end in self._split_range(y_min, y_max, slot_height):
+                slot = (slot_x, slot_x_end, slot_y, slot_y_end)
+                
+                # La esquina mas lejana decide si toda la celda queda en el radio
+                inside_checkpoint = False
+                for cp_x, cp_y in self.checkpoint_validator.points:
+                    dx = max(abs(slot_x - cp_x), abs(slot_x_end - cp_x))
+                    dy = max(abs(slot_y - cp_y), abs(slot_y_end - cp_y))
+                    if dx * dx + dy * dy < radius_squared:
+                        inside_checkpoint = True
+                        break
+                if inside_checkpoint:
+                    continue
+                
+                if any(self._slot_blocked_by(slot, ex, ey, horizontal_spacing)
+                       for ex, ey, _, _ in blockers):
+                    continue
+                
+                slots.append(slot)
         
-        return {
-            'x': x,
-            'y': y,
-            'width': width,
-            'height': config.platform_height
-        }
+        return slots
+    
+    @staticmethod
+    def _split_range(low: int, high: int, cell_size: int) -> List[Tuple[int, int]]:
+        """
+        Divide [low, high] en ceil(rango / cell_size) intervalos de igual
+        tamano (difieren a lo sumo en 1). Sin una ultima celda recortada,
+        todas las celdas tienen la misma probabilidad por unidad de area.
+        """
+        span = high - low + 1
+        count = -(-span // cell_size)
+        return [
+            (low + i * span // count, low + (i + 1) * span // count - 1)
+            for i in range(count)
+        ]
+    
+    @staticmethod
+    def _slot_blocked_by(slot: Tuple[int, int, int, int], x: int, y: int,
+                         horizontal_spacing: int) -> bool:
+        """
+        Verifica si ningun punto de la celda respeta el espaciado minimo con
+        una plataforma en (x, y); en ese caso la celda se cierra.
+        """
+        slot_x, slot_x_end, slot_y, slot_y_end = slot
+        max_dx = max(abs(slot_x - x), abs(slot_x_end - x))
+        max_dy = max(abs(slot_y - y), abs(slot_y_end - y))
+        return (max_dx < horizontal_spacing and
+                max_dy < WorldConstants.MIN_VERTICAL_SPACING)
     
-    def _validate_platform_placement(self, platform: Dict,
-                                    existing_platforms: List[Dict],
-                                    checkpoints: List[Dict],
+    def _validate_platform_placement(self, platform: PlatformDTO,
+                                    platform_grid: SpatialHashGrid,
+                                    platforms: List[PlatformDTO],
+                                    checkpoints: List[CheckpointDTO],
                                     config: PlatformConfig) -> bool:
         """Valida que una plataforma pueda colocarse"""
         # 1. Checkpoint
-        if self.checkpoint_validator.is_near_checkpoint(platform['x'], platform['y']):
+        if self.checkpoint_validator.is_near_checkpoint(platform.x, platform.y):
             return False
         
-        # 2. Overlap
-        for existing in existing_platforms:
-            if self.geometry.rectangles_overlap(
-                platform['x'], platform['y'], platform['width'], platform['height'],
-                existing['x'], existing['y'], existing['width'], existing['height']
-            ):
-                return False
+        x = platform.x
+        y = platform.y
+        width = platform.width
+        height = platform.height
         
-        # 3. Espaciado
-        for existing in existing_platforms:
-            h_dist = abs(platform['x'] - existing['x'])
-            v_dist = abs(platform['y'] - existing['y'])
+        # Solo las plataformas cercanas pueden solaparse o violar el espaciado
+        neighbours = platform_grid.query(
+            x, y, width, height,
+            pad_x=max(config.horizontal_spacing, WorldConstants.MIN_HORIZONTAL_SPACING),
+            pad_y=WorldConstants.MIN_VERTICAL_SPACING
+        )
+        
+        # 2 y 3. Overlap y espaciado
+        if self._conflicts_with_neighbours(
+            x, y, width, height, neighbours, config.horizontal_spacing
+        ):
+            return False
+        
+        # 4. Alcanzabilidad
+        return self._is_platform_reachable_from_any(platform, platforms)
+    
+    @staticmethod
+    def _insert_platform_record(platform_grid: SpatialHashGrid,
+                                platform: PlatformDTO):
+        """
+        Registra la plataforma en el indice como (x, y, right, bottom): los
+        bordes se suman una vez al insertar y no en cada comparacion.
+        """
+        right = platform.x + platform.width
+        bottom = platform.y + platform.height
+        platform_grid.insert(
+            (platform.x, platform.y, right, bottom),
+            platform.x, platform.y, platform.width, platform.height
+        )
+    
+    @staticmethod
+    def _conflicts_with_neighbours(x: int, y: int, width: int, height: int,
+                                   neighbours: List[Tuple[int, int, int, int]],
+                                   horizontal_spacing: int) -> bool:
+        """
+        Comprueba overlap y espaciado minimo contra las plataformas vecinas
+        en un solo recorrido de los registros (x, y, right, bottom).
+        """
+        right = x + width
+        bottom = y + height
+        min_vertical = WorldConstants.MIN_VERTICAL_SPACING
+        min_horizontal = WorldConstants.MIN_HORIZONTAL_SPACING
+        
+        for ex, ey, e_right, e_bottom in neighbours:
+            # Overlap (mismo criterio que GeometryValidator.rectangles_overlap)
+            if (right >= ex) & (e_right >= x) & (bottom >= ey) & (e_bottom >= y):
+                return True
             
-            if h_dist < config.horizontal_spacing and v_dist < WorldConstants.MIN_VERTICAL_SPACING:
-                return False
+            # Espaciado
+            h_dist = abs(x - ex)
+            v_dist = abs(y - ey)
             
-            if v_dist < 40 and h_dist < WorldConstants.MIN_HORIZONTAL_SPACING:
-                return False
+            if h_dist < horizontal_spacing and v_dist < min_vertical:
+                return True
+            
+            if v_dist < 40 and h_dist < min_horizontal:
+                return True
         
-        # 4. Alcanzabilidad
-        return self._is_platform_reachable_from_any(platform, existing_platforms)
+        return False
     
-    def _is_platform_reachable_from_any(self, platform: Dict,
-                                   existing_platforms: List[Dict]) -> bool:
+    def _is_platform_reachable_from_any(self, platform: PlatformDTO,
+                                   existing_platforms: List[PlatformDTO]) -> bool:
         """Verifica si la plataforma es alcanzable desde alguna existente"""
         # CAMBIO 1: Filtrar solo plataformas cercanas (aumentar rango)
         nearby_platforms = [
             p for p in existing_platforms
-            if abs(p['x'] - platform['x']) < 600  # Aumentado de 400 a 600
+            if abs(p.x - platform.x) < 600  # Aumentado de 400 a 600
         ]
         
         # CAMBIO 2: Si no hay plataformas cercanas pero hay plataformas
@@ -594,8 +883,8 @@ class WorldGenerator(ABC):
         if not nearby_platforms:
             if existing_platforms:
                 # Buscar la plataforma más cercana horizontalmente
-                closest = min(existing_platforms, key=lambda p: abs(p['x'] - platform['x']))
-                horizontal_dist = abs(closest['x'] - platform['x'])
+                closest = min(existing_platforms, key=lambda p: abs(p.x - platform.x))
+                horizontal_dist = abs(closest.x - platform.x)
                 
                 # Si está dentro de 2x el salto máximo, es válida
                 # (permite "cadenas" de plataformas)
@@ -609,11 +898,16 @@ class WorldGenerator(ABC):
                 # Primer plataforma flotante, siempre válida
                 return True
         
-        # CAMBIO 3: Verificar alcanzabilidad física
+        # CAMBIO 3: Verificar alcanzabilidad física, de la más cercana a la
+        # más lejana: casi siempre basta con la primera
+        px, py = platform.x, platform.y
+        nearby_platforms.sort(
+            key=lambda p: (p.x - px) * (p.x - px) + (p.y - py) * (p.y - py)
+        )
         for existing in nearby_platforms:
             if self.physics.is_platform_reachable(
-                existing['x'], existing['y'],
-                platform['x'], platform['y'], platform['width']
+                existing.x, existing.y,
+                platform.x, platform.y, platform.width
             ):
                 return True
         
@@ -626,77 +920,98 @@ class WorldGenerator(ABC):
     
     def _generate_hazards_with_config(self, width: int, height: int,
                                      config: HazardConfig,
-                                     platforms: List[Dict],
-                                     checkpoints: List[Dict]) -> List[Dict]:
-        """Genera espinas usando configuración específica"""
-        spikes = []
+                                     platforms: List[PlatformDTO],
+                                     spike_platform_idx: List[int],
+                                     checkpoints: List[CheckpointDTO]) -> List[SpikeDTO]:
+        """
+        Genera espinas usando configuración específica.
+        Primero se reúnen los candidatos de las tres fuentes (suelo, zonas de
+        peligro y plataformas) y luego se filtran los solapamientos en un solo
+        pase, respetando ese orden de prioridad.
+        """
         ground_y = height - 50
+        surfaces = self.physics.build_surface_index(platforms)
         
         start = config.safe_zone
         end = width - config.generation_end_offset
         generation_width = end - start
         zone_width = generation_width // config.num_zones
         
+        # El tamano de espina es fijo para todo el mundo
+        spike_width = config.spike_width
+        spike_height = config.spike_height
+        
+        candidates = []
+        
         # 1. Espinas individuales
-        spikes.extend(self._generate_individual_spikes(
+        candidates.extend(self._generate_individual_spikes(
             start, end, config.num_zones, zone_width, ground_y,
-            config.individual_spike_probability, config.spike_width,
-            config.spike_height, platforms, checkpoints
+            config.individual_spike_probability, spike_height,
+            surfaces, checkpoints
         ))
         
         # 2. Zonas de peligro
-        spikes.extend(self._generate_danger_zones(
+        candidates.extend(self._generate_danger_zones(
             start, config.num_zones, zone_width, ground_y,
             config.danger_zone_count, config.danger_zone_spike_count,
-            config.spike_width, config.spike_height, platforms, checkpoints, spikes
+            spike_height, surfaces, checkpoints
         ))
         
         # 3. Espinas en plataformas
-        spikes.extend(self._generate_platform_spikes(
-            platforms, config.platform_spike_range, config.spike_width,
-            config.spike_height, checkpoints, spikes
+        candidates.extend(self._generate_platform_spikes(
+            platforms, spike_platform_idx, config.platform_spike_range,
+            spike_height
         ))
         
-        return spikes
+        # 4. Filtro único de overlap
+        accepted = self._filter_overlapping_spikes(
+            candidates, spike_width, spike_height
+        )
+        
+        # 5. Los SpikeDTO se construyen una sola vez, solo para los
+        #    candidatos aceptados
+        return [
+            self._create_spike(x, y, spike_width, spike_height, on_platform)
+            for x, y, on_platform in accepted
+        ]
     
     def _generate_individual_spikes(self, start: int, end: int, num_zones: int,
                                    zone_width: int, ground_y: int,
-                                   probability: float, spike_width: int,
-                                   spike_height: int, platforms: List[Dict],
-                                   checkpoints: List[Dict]) -> List[Dict]:
-        """Genera espinas individuales en el suelo"""
+                                   probability: float, spike_height: int,
+                                   surfaces: Dict[int, List[Tuple[int, int]]],
+                                   checkpoints: List[CheckpointDTO]) -> List[SpikeCandidate]:
+        """Genera candidatos de espinas individuales en el suelo"""
         spikes = []
+        spike_y = ground_y - spike_height
+        rand = random.random
+        randint = random.randint
         
         for zone in range(num_zones):
             zone_start = start + (zone * zone_width)
             zone_end = zone_start + zone_width
             
-            if random.random() < probability:
+            if rand() < probability:
                 attempts = 0
                 while attempts < 10:
                     attempts += 1
                     
-                    spike = self._create_spike(
-                        random.randint(zone_start + 40, zone_end - 40),
-                        ground_y - spike_height,
-                        spike_width, spike_height
-                    )
+                    spike_x = randint(zone_start + 40, zone_end - 40)
                     
                     if self._validate_spike_placement(
-                        spike, ground_y, platforms, checkpoints, spikes
+                        spike_x, spike_y, spike_height, ground_y,
+                        surfaces, checkpoints
                     ):
-                        spikes.append(spike)
+                        spikes.append((spike_x, spike_y, False))
                         break
         
         return spikes
     
     def _generate_danger_zones(self, start: int, num_zones: int, zone_width: int,
                               ground_y: int, danger_zone_count: int,
-                              spikes_per_zone: int, spike_width: int,
-                              spike_height: int, platforms: List[Dict],
-                              checkpoints: List[Dict],
-                              existing_spikes: List[Dict]) -> List[Dict]:
-        """Genera zonas de peligro con múltiples espinas juntas"""
+                              spikes_per_zone: int, spike_height: int,
+                              surfaces: Dict[int, List[Tuple[int, int]]],
+                              checkpoints: List[CheckpointDTO]) -> List[SpikeCandidate]:
+        """Genera candidatos de zonas de peligro con múltiples espinas juntas"""
         spikes = []
         
         if num_zones < 4:
@@ -706,119 +1021,134 @@ class WorldGenerator(ABC):
             range(2, num_zones - 1),
             min(danger_zone_count, num_zones - 3)
         )
+        spike_y = ground_y - spike_height
         
         for danger_zone in danger_zones:
             zone_start = start + (danger_zone * zone_width)
             zone_center = zone_start + zone_width // 2
             
             if self.checkpoint_validator.is_near_checkpoint(
-                zone_center, ground_y - spike_height, 200
+                zone_center, spike_y, 200
             ):
                 continue
             
             # Generar espinas en la zona
             for i in range(spikes_per_zone):
-                spike = self._create_spike(
-                    zone_start + (i * 50) + 40,
-                    ground_y - spike_height,
-                    spike_width, spike_height
-                )
-                
-                all_spikes = existing_spikes + spikes
+                spike_x = zone_start + (i * 50) + 40
                 
                 if self._validate_spike_placement(
-                    spike, ground_y, platforms, checkpoints, all_spikes
+                    spike_x, spike_y, spike_height, ground_y,
+                    surfaces, checkpoints
                 ):
-                    spikes.append(spike)
+                    spikes.append((spike_x, spike_y, False))
         
         return spikes
     
-    def _generate_platform_spikes(self, platforms: List[Dict],
+    def _platforms_eligible_for_spikes(self, platforms: List[PlatformDTO]) -> List[int]:
+        """
+        Indices de las plataformas que pueden llevar espinas: altas, anchas y
+        con el centro lejos de los checkpoints.
+        """
+        checkpoint_points = self.checkpoint_validator.points
+        near_radius_squared = 200 * 200
+        eligible_idx = []
+        
+        for i, p in enumerate(platforms):
+            if p.y >= 500 or p.width < 80:
+                continue
+            
+            center_x = p.x + p.width // 2
+            near_checkpoint = False
+            for cp_x, cp_y in checkpoint_points:
+                dx = center_x - cp_x
+                dy = p.y - cp_y
+                if dx * dx + dy * dy < near_radius_squared:
+                    near_checkpoint = True
+                    break
+            
+            if not near_checkpoint:
+                eligible_idx.append(i)
+        
+        return eligible_idx
+    
+    def _generate_platform_spikes(self, platforms: List[PlatformDTO],
+                                 eligible_idx: List[int],
                                  spike_range: Tuple[int, int],
-                                 spike_width: int, spike_height: int,
-                                 checkpoints: List[Dict],
-                                 existing_spikes: List[Dict]) -> List[Dict]:
-        """Genera espinas sobre plataformas"""
+                                 spike_height: int) -> List[SpikeCandidate]:
+        """Genera candidatos de espinas sobre las plataformas elegibles"""
         spikes = []
         
-        # Filtrar plataformas elegibles
-        eligible = [
-            p for p in platforms
-            if p['y'] < 500 and p['width'] >= 80 and
-            not self.checkpoint_validator.is_near_checkpoint(
-                p['x'] + p['width'] // 2, p['y'], 200
-            )
-        ]
-        
-        if not eligible:
+        if not eligible_idx:
             return spikes
         
-        num_spikes = min(random.randint(*spike_range), len(eligible))
-        selected = random.sample(eligible, num_spikes)
+        num_spikes = min(random.randint(*spike_range), len(eligible_idx))
+        selected_idx = random.sample(eligible_idx, num_spikes)
         
-        for platform in selected:
-            available_space = platform['width'] - 60
+        for platform_index in selected_idx:
+            platform = platforms[platform_index]
+            available_space = platform.width - 60
             if available_space < 40:
                 continue
             
             offset = random.randint(20, int(available_space))
             
-            spike = self._create_spike(
-                platform['x'] + offset,
-                platform['y'] - spike_height,
-                spike_width, spike_height
-            )
-            
-            # Validar overlap con otras espinas
+            spikes.append((
+                platform.x + offset,
+                platform.y - spike_height,
+                True
+            ))
+        
+        return spikes
+    
+    def _filter_overlapping_spikes(self, candidates: List[SpikeCandidate],
+                                   spike_width: int,
+                                   spike_height: int) -> List[SpikeCandidate]:
+        """
+        Acepta los candidatos en orden de prioridad, descartando los que se
+        solapan con alguna espina ya aceptada.
+        Como todas las espinas miden lo mismo, rectangles_overlap se reduce a
+        |dx| <= ancho y |dy| <= alto.
+        """
+        spikes = []
+        spike_grid = SpatialHashGrid()
+        
+        for spike in candidates:
+            x, y, _ = spike
             overlap = False
-            for existing in existing_spikes + spikes:
-                if self.geometry.rectangles_overlap(
-                    spike['x'], spike['y'], spike['width'], spike['height'],
-                    existing['x'], existing['y'], existing['width'], existing['height']
-                ):
+            for ex, ey, _ in spike_grid.query(x, y, spike_width, spike_height):
+                if abs(x - ex) <= spike_width and abs(y - ey) <= spike_height:
                     overlap = True
                     break
             
             if not overlap:
-                spike['on_platform'] = True
                 spikes.append(spike)
+                spike_grid.insert(spike, x, y, spike_width, spike_height)
         
         return spikes
     
-    def _create_spike(self, x: int, y: int, width: int, height: int) -> Dict:
+    def _create_spike(self, x: int, y: int, width: int, height: int,
+                      on_platform: bool = False) -> SpikeDTO:
         """Crea una espina con las dimensiones especificadas"""
-        return {
-            'x': x,
-            'y': y,
-            'width': width,
-            'height': height
-        }
-    
-    def _validate_spike_placement(self, spike: Dict, ground_y: int,
-                                  platforms: List[Dict],
-                                  checkpoints: List[Dict],
-                                  existing_spikes: List[Dict]) -> bool:
-        """Valida que una espina pueda colocarse"""
+        return SpikeDTO(x, y, width, height, on_platform)
+    
+    def _validate_spike_placement(self, spike_x: int, spike_y: int,
+                                  spike_height: int, ground_y: int,
+                                  surfaces: Dict[int, List[Tuple[int, int]]],
+                                  checkpoints: List[CheckpointDTO]) -> bool:
+        """
+        Valida que una espina pueda colocarse (el overlap con otras espinas
+        se resuelve despues en _filter_overlapping_spikes)
+        """
         # 1. Checkpoint
-        if self.checkpoint_validator.is_near_checkpoint(
-            spike['x'], spike['y'], 150
-        ):
+        if self.checkpoint_validator.is_near_checkpoint(spike_x, spike_y, 150):
             return False
         
         # 2. Debe estar sobre superficie
         if not self.physics.is_on_surface(
-            spike['x'], spike['y'], spike['height'], platforms, ground_y
+            spike_x, spike_y, spike_height, surfaces, ground_y
         ):
             return False
         
-        # 3. No overlap con otras espinas
-        for existing in existing_spikes:
-            if self.geometry.rectangles_overlap(
-                spike['x'], spike['y'], spike['width'], spike['height'],
-                existing['x'], existing['y'], existing['width'], existing['height']
-            ):
-                return False
-        
         return True
     
     # ========================================================================
@@ -826,73 +1156,84 @@ class WorldGenerator(ABC):
     # ========================================================================
     
     def _generate_enemies(self, width: int, height: int,
-                         platforms: List[Dict],
-                         checkpoints: List[Dict],
-                         goal: Dict) -> List[Dict]:
+                         platforms: List[PlatformDTO],
+                         checkpoints: List[CheckpointDTO],
+                         goal: GoalDTO) -> List[EnemyDTO]:
         """Genera enemigos sobre plataformas"""
         enemies = []
+        enemy_xs = []  # 'x' de los enemigos colocados, ordenadas
         safe_zone_x = 500
+        rand = random.random
+        randint = random.randint
+        
+        # Constantes como locales: se consultan por cada plataforma
+        ground_min_y = height - 60
+        chance_ground = WorldConstants.ENEMY_SPAWN_CHANCE_GROUND
+        chance_platform = WorldConstants.ENEMY_SPAWN_CHANCE
+        enemy_width = WorldConstants.ENEMY_WIDTH
+        enemy_height = WorldConstants.ENEMY_HEIGHT
         
         for platform in platforms:
             # Validaciones básicas
-            if platform['width'] < 80:
+            if platform.width < 80:
                 continue
             
-            if platform['x'] + platform['width'] <= safe_zone_x:
+            if platform.x + platform.width <= safe_zone_x:
                 continue
             
-            is_ground = (platform['y'] >= height - 60)
+            is_ground = (platform.y >= ground_min_y)
             
-            probability = (WorldConstants.ENEMY_SPAWN_CHANCE_GROUND if is_ground
-                          else WorldConstants.ENEMY_SPAWN_CHANCE)
+            probability = chance_ground if is_ground else chance_platform
             
-            if random.random() > probability:
+            if rand() > probability:
                 continue
             
             # Posición válida en la plataforma
-            min_x = max(platform['x'] + 40, safe_zone_x + 40)
-            max_x = platform['x'] + platform['width'] - 40
+            min_x = max(platform.x + 40, safe_zone_x + 40)
+            max_x = platform.x + platform.width - 40
             
             if max_x <= min_x:
                 continue
             
-            enemy_x = random.randint(int(min_x), int(max_x))
-            enemy_y = platform['y'] - 50
+            enemy_x = randint(int(min_x), int(max_x))
+            enemy_y = platform.y - 50
             
             # Validar distancias
             if self._validate_enemy_placement(
-                enemy_x, enemy_y, checkpoints, goal, enemies
+                enemy_x, enemy_y, checkpoints, goal, enemy_xs
             ):
-                enemies.append({
-                    'x': enemy_x,
-                    'y': enemy_y,
-                    'width': WorldConstants.ENEMY_WIDTH,
-                    'height': WorldConstants.ENEMY_HEIGHT
-                })
+                enemy = EnemyDTO(enemy_x, enemy_y, enemy_width, enemy_height)
+                enemies.append(enemy)
+                bisect.insort(enemy_xs, enemy_x)
         
         return enemies
     
     def _validate_enemy_placement(self, x: int, y: int,
-                                  checkpoints: List[Dict],
-                                  goal: Dict,
-                                  existing_enemies: List[Dict]) -> bool:
+                                  checkpoints: List[CheckpointDTO],
+                                  goal: GoalDTO,
+                                  enemy_xs: List[int]) -> bool:
         """Valida que un enemigo pueda colocarse"""
         # Checkpoints
-        for checkpoint in checkpoints:
-            if (abs(x - checkpoint['x']) < 200 and
-                abs(y - checkpoint['y']) < 150):
-                return False
+        if self.checkpoint_validator.is_within_box(x, y, 200, 150):
+            return False
         
         # Goal
-        if goal and abs(x - goal['x']) < 300 and abs(y - goal['y']) < 150:
+        if goal and abs(x - goal.x) < 300 and abs(y - goal.y) < 150:
             return False
         
         # Otros enemigos
-        for enemy in existing_enemies:
-            if abs(x - enemy['x']) < 100:
-                return False
-        
-        return True
+        return not self._has_x_within(enemy_xs, x, 100)
+    
+    @staticmethod
+    def _has_x_within(sorted_xs: List[int], x: int, min_distance: int) -> bool:
+        """
+        Verifica si alguna 'x' de la lista ordenada cumple |x' - x| < min_distance.
+        Basta con mirar los vecinos inmediatos a cada lado.
+        """
+        i = bisect.bisect_left(sorted_xs, x)
+        if i < len(sorted_xs) and sorted_xs[i] - x < min_distance:
+            return True
+        return i > 0 and x - sorted_xs[i - 1] < min_distance
     
     # ========================================================================
     # GENERACIÓN DE POWERUPS - REFACTORIZADO
@@ -900,106 +1241,316 @@ class WorldGenerator(ABC):
     
     def _generate_powerups_with_config(self, width: int, height: int,
                                       config: PowerUpConfig,
-                                      platforms: List[Dict],
-                                      checkpoints: List[Dict],
-                                      goal: Dict,
-                                      enemies: List[Dict],
-                                      spikes: List[Dict]) -> List[Dict]:
-        """Genera PowerUps usando configuración de probabilidades"""
+                                      powerup_platforms: Tuple[List[int], List[Tuple]],
+                                      checkpoints: List[CheckpointDTO],
+                                      goal: GoalDTO,
+                                      enemies: List[EnemyDTO],
+                                      spikes: List[SpikeDTO]) -> List[PowerUpDTO]:
+        """
+        Genera PowerUps usando configuración de probabilidades.
+        'powerup_platforms' son las plataformas aptas ordenadas por 'x'
+        (ver _sort_platforms_for_powerups).
+        """
         powerups = []
         num_powerups = (width // 1000) + random.randint(2, 4)
         
+        # Las distancias a enemigos y powerups solo dependen de 'x': listas
+        # ordenadas. Las espinas usan un indice espacial con (x, y)
+        enemy_xs = sorted(enemy.x for enemy in enemies)
+        powerup_xs = []
+        
+        spike_grid = SpatialHashGrid()
+        for spike in spikes:
+            spike_grid.insert((spike.x, spike.y), spike.x, spike.y, 0, 0)
+        
         attempts = 0
         max_attempts = num_powerups * 15
         
+        platform_xs, platform_entries = powerup_platforms
+        
+        # Distribucion de tipos validada una vez por nivel (Registry)
+        powerup_types, powerup_cdf = self._powerup_selector.build_cdf(
+            config.probabilities
+        )
+        sample_type = self._powerup_selector.sample
+        
+        randint = random.randint
+        choice = random.choice
+        placement_types = ('on_platform', 'floating')
+        x_min, x_max = WorldConstants.POWERUP_SAFE_ZONE, width - 200
+        floating_y_min, floating_y_max = height - 400, height - 150
+        powerup_width = WorldConstants.POWERUP_WIDTH
+        powerup_height = WorldConstants.POWERUP_HEIGHT
+        
         while len(powerups) < num_powerups and attempts < max_attempts:
             attempts += 1
             
             # Generar posición
-            x = random.randint(WorldConstants.POWERUP_SAFE_ZONE, width - 200)
-            placement_type = random.choice(['on_platform', 'floating'])
+            x = randint(x_min, x_max)
+            placement_type = choice(placement_types)
             
             if placement_type == 'on_platform':
-                platform = self._find_suitable_platform(x, platforms, height)
+                platform = self._find_suitable_platform(
+                    x, platform_xs, platform_entries
+                )
                 if not platform:
                     continue
-                x = platform['x'] + platform['width'] // 2
-                y = platform['y'] - 40
+                x = platform.x + platform.width // 2
+                y = platform.y - 40
             else:
-                y = random.randint(height - 400, height - 150)
+                y = randint(floating_y_min, floating_y_max)
             
             # Validar posición
             if self._validate_powerup_placement(
-                x, y, checkpoints, goal, enemies, spikes, powerups
+                x, y, checkpoints, goal, enemy_xs, spike_grid, powerup_xs
             ):
-                powerup_type = self._powerup_selector.select_from_probabilities(
-                    config.probabilities
+                powerup_type = sample_type(powerup_types, powerup_cdf)
+                powerup = PowerUpDTO(
+                    x, y, type=powerup_type,
+                    width=powerup_width, height=powerup_height
                 )
-                powerups.append({
-                    'x': x,
-                    'y': y,
-                    'width': WorldConstants.POWERUP_WIDTH,
-                    'height': WorldConstants.POWERUP_HEIGHT,
-                    'type': powerup_type
-                })
+                powerups.append(powerup)
+                bisect.insort(powerup_xs, x)
         
         return powerups
     
-    def _find_suitable_platform(self, x: int, platforms: List[Dict],
-                               height: int) -> Optional[Dict]:
+    @staticmethod
+    def _sort_platforms_for_powerups(platforms: List[PlatformDTO],
+                                     height: int) -> Tuple[List[int], List[Tuple]]:
+        """
+        Retorna las plataformas aptas para PowerUps (y < height - 100)
+        ordenadas por 'x' como (xs, entradas), donde cada entrada es
+        (x, indice_original, plataforma).
+        """
+        max_y = height - 100
+        entries = sorted(
+            (p.x, i, p) for i, p in enumerate(platforms) if p.y < max_y
+        )
+        xs = [entry[0] for entry in entries]
+        return xs, entries
+    
+    @staticmethod
+    def _find_suitable_platform(x: int, xs: List[int],
+                                entries: List[Tuple]) -> Optional[PlatformDTO]:
         """Encuentra plataforma cercana adecuada para PowerUp"""
+        # La mas cercana es el vecino inmediato a la izquierda o a la derecha
+        idx = bisect.bisect_left(xs, x)
+        best_key = None
         suitable = None
-        min_distance = float('inf')
         
-        for platform in platforms:
-            if platform['y'] >= height - 100:
-                continue
-            
-            distance = abs(platform['x'] - x)
-            if distance < min_distance and distance < 300:
-                min_distance = distance
+        if idx < len(xs):
+            _, index, suitable = entries[idx]
+            best_key = (xs[idx] - x, index)
+        
+        if idx > 0:
+            # Con 'x' repetidas, la primera de la racha es la de menor indice
+            left = bisect.bisect_left(xs, xs[idx - 1])
+            _, index, platform = entries[left]
+            # Empates: gana la que aparece primero en la lista original
+            key = (x - xs[left], index)
+            if best_key is None or key < best_key:
+                best_key = key
                 suitable = platform
         
+        if best_key is None or best_key[0] >= 300:
+            return None
         return suitable
     
     def _validate_powerup_placement(self, x: int, y: int,
-                                   checkpoints: List[Dict],
-                                   goal: Dict,
-                                   enemies: List[Dict],
-                                   spikes: List[Dict],
-                                   existing_powerups: List[Dict]) -> bool:
+                                   checkpoints: List[CheckpointDTO],
+                                   goal: GoalDTO,
+                                   enemy_xs: List[int],
+                                   spike_grid: SpatialHashGrid,
+                                   powerup_xs: List[int]) -> bool:
         """Valida que un PowerUp pueda colocarse"""
+        # Constantes como locales: se consultan en cada intento
+        min_enemy = WorldConstants.POWERUP_MIN_DISTANCE_ENEMY
+        min_spike_x = WorldConstants.POWERUP_MIN_DISTANCE_SPIKE_X
+        min_spike_y = WorldConstants.POWERUP_MIN_DISTANCE_SPIKE_Y
+        min_powerup = WorldConstants.POWERUP_MIN_DISTANCE_POWERUP
+        
         # Checkpoints
-        for checkpoint in checkpoints:
-            if (abs(x - checkpoint['x']) < WorldConstants.POWERUP_MIN_DISTANCE_CHECKPOINT and
-                abs(y - checkpoint['y']) < 100):
-                return False
+        if self.checkpoint_validator.is_within_box(
+            x, y, WorldConstants.POWERUP_MIN_DISTANCE_CHECKPOINT, 100
+        ):
+            return False
         
         # Goal
-        if goal and (abs(x - goal['x']) < WorldConstants.POWERUP_MIN_DISTANCE_GOAL and
-                    abs(y - goal['y']) < 150):
+        if goal and (abs(x - goal.x) < WorldConstants.POWERUP_MIN_DISTANCE_GOAL and
+                    abs(y - goal.y) < 150):
             return False
         
         # Enemigos
-        for enemy in enemies:
-            if abs(x - enemy['x']) < WorldConstants.POWERUP_MIN_DISTANCE_ENEMY:
-                return False
+        if self._has_x_within(enemy_xs, x, min_enemy):
+            return False
         
         # Spikes
-        for spike in spikes:
-            if (abs(x - spike['x']) < WorldConstants.POWERUP_MIN_DISTANCE_SPIKE_X and
-                abs(y - spike['y']) < WorldConstants.POWERUP_MIN_DISTANCE_SPIKE_Y):
+        for spike_x, spike_y in spike_grid.query(
+            x, y, 0, 0,
+            pad_x=min_spike_x, pad_y=min_spike_y
+        ):
+            if (abs(x - spike_x) < min_spike_x and
+                abs(y - spike_y) < min_spike_y):
                 return False
         
         # Otros PowerUps
-        for powerup in existing_powerups:
-            if abs(x - powerup['x']) < WorldConstants.POWERUP_MIN_DISTANCE_POWERUP:
-                return False
-        
-        return True
+        return not self._has_x_within(powerup_xs, x, min_powerup)
     
 
 
+# ============================================================================
+# CONFIGURACIONES DE MUNDO
+# ============================================================================
+# Cada configuracion es constante: se construye una sola vez al importar el
+# modulo. Las dataclasses son congeladas y sus diccionarios y listas internos
+# de solo lectura (MappingProxyType y tuplas): ningun nivel puede alterarlos.
+
+_GRASS_CONFIG = WorldConfig(
+    name="Mundo de Pasto",
+    colors=MappingProxyType({
+        'sky': (135, 206, 235),
+        'ground': (34, 139, 34),
+        'platform': (101, 67, 33),
+        'hazard': (255, 0, 0)
+    }),
+    platform_config=PlatformConfig(
+        starting_platforms=(
+            MappingProxyType({'x': 150, 'y': 450, 'width': 150, 'height': 20}),
+            MappingProxyType({'x': 350, 'y': 380, 'width': 130, 'height': 20}),
+        ),
+        num_segments=6,
+        platforms_per_segment=(1, 3),
+        height_range=(130, 280),
+        width_range=(130, 180),
+        platform_height=20,
+        margin_left_pct=0.10,
+        margin_right_pct=0.15,
+        horizontal_spacing=200,
+        generation_start=600,
+        generation_end_offset=400
+    ),
+    hazard_config=HazardConfig(
+        safe_zone=500,
+        generation_end_offset=300,
+        num_zones=10,
+        individual_spike_probability=0.25,
+        danger_zone_count=2,
+        danger_zone_spike_count=2,
+        platform_spike_range=(0, 2),
+        spike_width=40,
+        spike_height=30
+    ),
+    powerup_config=PowerUpConfig(
+        probabilities=MappingProxyType({
+            'speed': 0.25,
+            'jump': 0.50,
+            'life': 0.25
+        })
+    ),
+    music_file='grass_theme.mp3'
+)
+
+
+_DESERT_CONFIG = WorldConfig(
+    name="Mundo Desértico",
+    colors=MappingProxyType({
+        'sky': (255, 218, 185),
+        'ground': (210, 180, 140),
+        'platform': (139, 90, 43),
+        'hazard': (255, 140, 0)
+    }),
+    platform_config=PlatformConfig(
+        starting_platforms=(
+            MappingProxyType({'x': 180, 'y': 420, 'width': 120, 'height': 18}),
+            MappingProxyType({'x': 380, 'y': 360, 'width': 110, 'height': 18}),
+        ),
+        num_segments=7,
+        platforms_per_segment=(1, 2),
+        height_range=(130, 300),
+        width_range=(100, 140),
+        platform_height=18,
+        margin_left_pct=0.15,
+        margin_right_pct=0.25,
+        horizontal_spacing=220,
+        generation_start=600,
+        generation_end_offset=400
+    ),
+    hazard_config=HazardConfig(
+        safe_zone=400,
+        generation_end_offset=250,
+        num_zones=12,
+        individual_spike_probability=0.45,
+        danger_zone_count=3,
+        danger_zone_spike_count=2,
+        platform_spike_range=(2, 3),
+        spike_width=38,
+        spike_height=32
+    ),
+    powerup_config=PowerUpConfig(
+        probabilities=MappingProxyType({
+            'speed': 0.25,
+            'jump': 0.25,
+            'life': 0.50
+        })
+    ),
+    music_file='desert_theme.mp3'
+)
+
+
+_ICE_CONFIG = WorldConfig(
+    name="Mundo de Hielo",
+    colors=MappingProxyType({
+        'sky': (176, 224, 230),
+        'ground': (240, 248, 255),
+        'platform': (175, 238, 238),
+        'hazard': (70, 130, 180)
+    }),
+    platform_config=PlatformConfig(
+        starting_platforms=(
+            MappingProxyType({'x': 220, 'y': 400, 'width': 85, 'height': 15}),
+            MappingProxyType({'x': 450, 'y': 320, 'width': 80, 'height': 15}),
+        ),
+        num_segments=8,
+        platforms_per_segment=(1, 2),
+        height_range=(140, 350),
+        width_range=(65, 95),
+        platform_height=15,
+        margin_left_pct=0.25,
+        margin_right_pct=0.35,
+        horizontal_spacing=270,
+        generation_start=700,
+        generation_end_offset=400
+    ),
+    hazard_config=HazardConfig(
+        safe_zone=350,
+        generation_end_offset=200,
+        num_zones=16,
+        individual_spike_probability=0.65,
+        danger_zone_count=5,
+        danger_zone_spike_count=2,
+        platform_spike_range=(5, 7),
+        spike_width=35,
+        spike_height=35
+    ),
+    powerup_config=PowerUpConfig(
+        probabilities=MappingProxyType({
+            'speed': 0.25,
+            'jump': 0.25,
+            'life': 0.50
+        })
+    ),
+    music_file='ice_theme.mp3'
+)
+
+# Tabla de despacho: configuracion por nombre corto de mundo. Es la unica
+# fuente de la que leen los generadores concretos
+_WORLD_CONFIGS: Mapping[str, WorldConfig] = MappingProxyType({
+    'grass': _GRASS_CONFIG,
+    'desert': _DESERT_CONFIG,
+    'ice': _ICE_CONFIG,
+})
+
+
 # ============================================================================
 # GENERADORES CONCRETOS (Template Method Implementations)
 # ============================================================================
@@ -1013,50 +1564,7 @@ class GrassWorldGenerator(WorldGenerator):
     
     def get_world_config(self) -> WorldConfig:
         """Retorna la configuracion de dificultad y estetica para el Nivel 1."""
-        return WorldConfig(
-            name="Mundo de Pasto",
-            colors={
-                'sky': (135, 206, 235),
-                'ground': (34, 139, 34),
-                'platform': (101, 67, 33),
-                'hazard': (255, 0, 0)
-            },
-            platform_config=PlatformConfig(
-                starting_platforms=[
-                    {'x': 150, 'y': 450, 'width': 150, 'height': 20},
-                    {'x': 350, 'y': 380, 'width': 130, 'height': 20}
-                ],
-                num_segments=6,
-                platforms_per_segment=(1, 3),
-                height_range=(130, 280),
-                width_range=(130, 180),
-                platform_height=20,
-                margin_left_pct=0.10,
-                margin_right_pct=0.15,
-                horizontal_spacing=200,
-                generation_start=600,
-                generation_end_offset=400
-            ),
-            hazard_config=HazardConfig(
-                safe_zone=500,
-                generation_end_offset=300,
-                num_zones=10,
-                individual_spike_probability=0.25,
-                danger_zone_count=2,
-                danger_zone_spike_count=2,
-                platform_spike_range=(0, 2),
-                spike_width=40,
-                spike_height=30
-            ),
-            powerup_config=PowerUpConfig(
-                probabilities={
-                    'speed': 0.25,
-                    'jump': 0.50,
-                    'life': 0.25
-                }
-            ),
-            music_file='grass_theme.mp3'
-        )
+        return _WORLD_CONFIGS['grass']
 
 
 class DesertWorldGenerator(WorldGenerator):
@@ -1068,50 +1576,7 @@ class DesertWorldGenerator(WorldGenerator):
     
     def get_world_config(self) -> WorldConfig:
         """Retorna la configuracion de dificultad y estetica para el Nivel 2."""
-        return WorldConfig(
-            name="Mundo Desértico",
-            colors={
-                'sky': (255, 218, 185),
-                'ground': (210, 180, 140),
-                'platform': (139, 90, 43),
-                'hazard': (255, 140, 0)
-            },
-            platform_config=PlatformConfig(
-                starting_platforms=[
-                    {'x': 180, 'y': 420, 'width': 120, 'height': 18},
-                    {'x': 380, 'y': 360, 'width': 110, 'height': 18}
-                ],
-                num_segments=7,
-                platforms_per_segment=(1, 2),
-                height_range=(130, 300),
-                width_range=(100, 140),
-                platform_height=18,
-                margin_left_pct=0.15,
-                margin_right_pct=0.25,
-                horizontal_spacing=220,
-                generation_start=600,
-                generation_end_offset=400
-            ),
-            hazard_config=HazardConfig(
-                safe_zone=400,
-                generation_end_offset=250,
-                num_zones=12,
-                individual_spike_probability=0.45,
-                danger_zone_count=3,
-                danger_zone_spike_count=2,
-                platform_spike_range=(2, 3),
-                spike_width=38,
-                spike_height=32
-            ),
-            powerup_config=PowerUpConfig(
-                probabilities={
-                    'speed': 0.25,
-                    'jump': 0.25,
-                    'life': 0.50
-                }
-            ),
-            music_file='desert_theme.mp3'
-        )
+        return _WORLD_CONFIGS['desert']
 
 
 class IceWorldGenerator(WorldGenerator):
@@ -1123,47 +1588,4 @@ class IceWorldGenerator(WorldGenerator):
     
     def get_world_config(self) -> WorldConfig:
         """Retorna la configuracion de dificultad y estetica para el Nivel 3."""
-        return WorldConfig(
-            name="Mundo de Hielo",
-            colors={
-                'sky': (176, 224, 230),
-                'ground': (240, 248, 255),
-                'platform': (175, 238, 238),
-                'hazard': (70, 130, 180)
-            },
-            platform_config=PlatformConfig(
-                starting_platforms=[
-                    {'x': 220, 'y': 400, 'width': 85, 'height': 15},
-                    {'x': 450, 'y': 320, 'width': 80, 'height': 15}
-                ],
-                num_segments=8,
-                platforms_per_segment=(1, 2),
-                height_range=(140, 350),
-                width_range=(65, 95),
-                platform_height=15,
-                margin_left_pct=0.25,
-                margin_right_pct=0.35,
-                horizontal_spacing=270,
-                generation_start=700,
-                generation_end_offset=400
-            ),
-            hazard_config=HazardConfig(
-                safe_zone=350,
-                generation_end_offset=200,
-                num_zones=16,
-                individual_spike_probability=0.65,
-                danger_zone_count=5,
-                danger_zone_spike_count=2,
-                platform_spike_range=(5, 7),
-                spike_width=35,
-                spike_height=35
-            ),
-            powerup_config=PowerUpConfig(
-                probabilities={
-                    'speed': 0.25,
-                    'jump': 0.25,
-                    'life': 0.50
-                }
-            ),
-            music_file='ice_theme.mp3'
-        )
\ No newline at end of file
+        return _WORLD_CONFIGS['ice']
@@ -5,16 +5,47 @@ y convertirlos en instancias de entidades de juego utilizables.
 Actua como una Factoria o Builder que ensambla el nivel final.
 """
 
+import sys
+from operator import attrgetter, itemgetter
+
+import pygame
 from entities import Platform, Spike, Checkpoint, Goal
 from Powerups_Enemies import EnemyContext, PowerUpContext
+from entity_pool import EntityPool
+
+
+# Tabla de colores compartidos: cada RGB existe una sola vez aunque el mundo
+# se regenere, y los colores que llegan como listas u otras secuencias se
+# normalizan a la misma tupla
+_COLOR_INTERN = {}
+
+
+# Lectores de campos de los DTOs: extraen la tupla completa en una llamada en C
+_BOX_FIELDS = attrgetter('x', 'y', 'width', 'height')
+_POWERUP_FIELDS = attrgetter('x', 'y', 'type', 'width', 'height')
+
+
+def _intern_color(color):
+    """Retorna la instancia compartida de un color RGB."""
+    color = tuple(color)
+    return _COLOR_INTERN.setdefault(color, color)
 
 
 class WorldLoader:
     """
     Clase encargada de la instanciacion de objetos del nivel.
-    Convierte diccionarios de configuracion en objetos PyGame/Entidades.
+    Convierte los DTOs del generador (ver dtos.py) en objetos PyGame/Entidades.
     """
     
+    # Todos los atributos se crean en __init__; sin __dict__ por instancia
+    __slots__ = (
+        'platforms', 'spikes', 'checkpoints', 'enemies', 'powerups', 'goal',
+        'colors', 'world_name', 'music_file',
+        '_platform_data_cache', '_pending_enemies', '_pending_powerups',
+        '_platform_pool', '_spike_pool', '_enemy_pool', '_powerup_pool',
+        '_box_builders',
+    )
+    
     def __init__(self):
         self.platforms = []
         self.spikes = []
@@ -25,114 +56,181 @@ class WorldLoader:
         self.colors = {}
         self.world_name = ""
         self.music_file = None
+        self._platform_data_cache = ()
+        self._pending_enemies = []
+        self._pending_powerups = []
+        
+        # Object Pool: entidades del nivel anterior reutilizadas en la carga
+        self._platform_pool = EntityPool(Platform)
+        self._spike_pool = EntityPool(Spike)
+        self._enemy_pool = EntityPool(EnemyContext)
+        self._powerup_pool = EntityPool(PowerUpContext)
+        
+        # Constructores especializados por (clase, color), reutilizados
+        # entre cargas; los colores estan internados, la clave es estable
+        self._box_builders = {}
     
     def load_world(self, world_data):
         """
-        Procesa el diccionario de datos del mundo y puebla las listas de entidades.
+        Procesa los datos del mundo y puebla las listas de entidades.
         
         Args:
-            world_data (dict): Diccionario con la configuracion del nivel generada.
+            world_data (WorldData): Configuracion del nivel generada.
         """
-        self.colors = world_data['colors']
-        self.world_name = world_data['name']
-        self.music_file = world_data['music']
+        # Una sola lectura de cada campo del DTO; el resto usa variables locales
+        (platform_data, spike_data, checkpoint_data, powerup_data,
+         enemy_data, goal_data, colors, name, music) = (
+            world_data.platforms, world_data.spikes, world_data.checkpoints,
+            world_data.powerups, world_data.enemies, world_data.goal,
+            world_data.colors, world_data.name, world_data.music
+        )
+        
+        self._release_entities()
+        
+        self.colors = {
+            key: _intern_color(value)
+            for key, value in colors.items()
+        }
+        self.world_name = name
+        self.music_file = music
         
         # Crear plataformas
-        self.platforms = self._create_platforms(world_data['platforms'])
+        self.platforms = self._create_platforms(platform_data)
+        # Las plataformas no cambian tras la carga: sus Rects se crean una vez
+        # y la cache solo se invalida aqui, al cargar otro mundo
+        self._platform_data_cache = self._create_platform_rects(platform_data)
         
         # Crear espinas
-        self.spikes = self._create_spikes(world_data['spikes'])
+        self.spikes = self._create_spikes(spike_data)
         
         # Crear checkpoints
-        self.checkpoints = self._create_checkpoints(world_data['checkpoints'])
+        self.checkpoints = self._create_checkpoints(checkpoint_data)
         
         # Crear goal
-        self.goal = self._create_goal(world_data['goal'])
-        
-        # Crear enemigos (Flyweight)
-        self.enemies = self._create_enemies(world_data.get('enemies', []))
+        self.goal = self._create_goal(goal_data)
         
-        # Crear PowerUps (Flyweight)
-        self.powerups = self._create_powerups(world_data.get('powerups', []))
-        
-        print(f"Mundo cargado: {self.world_name}")
+        # Enemigos y PowerUps (Flyweight): quedan pendientes, ordenados por x,
+        # y se instancian cuando la camara se acerca (ver activate_entities)
+        self.enemies = []
+        self._pending_enemies = self._sort_pending(
+            self._normalize_enemies(enemy_data)
+        )
+        self.powerups = []
+        self._pending_powerups = self._sort_pending(
+            self._normalize_powerups(powerup_data)
+        )
+    
+    def _release_entities(self):
+        """Devuelve a sus pools las entidades del nivel que se descarga."""
+        self._platform_pool.release_all(self.platforms)
+        self._spike_pool.release_all(self.spikes)
+        self._enemy_pool.release_all(self.enemies)
+        self._powerup_pool.release_all(self.powerups)
     
     def _create_platforms(self, platform_data):
-        """Instancia objetos Platform desde datos crudos."""
-        platforms = []
-        for p in platform_data:
-            platform = Platform(
-                p['x'], p['y'], p['width'], p['height'],
-                self.colors['platform']
-            )
-            platforms.append(platform)
-        return platforms
+        """Instancia objetos Platform desde PlatformDTOs."""
+        build = self._get_box_builder(
+            Platform, self._platform_pool, self.colors['platform']
+        )
+        return build(platform_data)
+    
+    def _create_platform_rects(self, platform_data):
+        """Construye los pygame.Rect de colision de cada plataforma."""
+        return tuple(map(pygame.Rect, map(_BOX_FIELDS, platform_data)))
     
     def _create_spikes(self, spike_data):
-        """Instancia objetos Spike desde datos crudos."""
-        spikes = []
-        for s in spike_data:
-            spike = Spike(
-                s['x'], s['y'], s['width'], s['height'],
-                self.colors['hazard']
-            )
-            spikes.append(spike)
-        return spikes
+        """Instancia objetos Spike desde SpikeDTOs."""
+        build = self._get_box_builder(
+            Spike, self._spike_pool, self.colors['hazard']
+        )
+        return build(spike_data)
+    
+    def _get_box_builder(self, entity_cls, pool, color):
+        """
+        Retorna (creandolo la primera vez) un constructor especializado para
+        entidades de caja (x, y, width, height, color) de entity_cls.
+        El pool, el color y el lector de campos quedan fijados como argumentos
+        por defecto del closure: dentro del bucle son variables locales.
+        """
+        key = (entity_cls, color)
+        builder = self._box_builders.get(key)
+        if builder is None:
+            def builder(data, _acquire=pool.acquire, _color=color,
+                        _fields=_BOX_FIELDS):
+                return [_acquire(*box, _color) for box in map(_fields, data)]
+            self._box_builders[key] = builder
+        return builder
     
     def _create_checkpoints(self, checkpoint_data):
-        """Instancia objetos Checkpoint desde datos crudos."""
-        checkpoints = []
-        for i, c in enumerate(checkpoint_data):
-            checkpoint = Checkpoint(c['x'], c['y'], i)
-            checkpoints.append(checkpoint)
-        return checkpoints
+        """Instancia objetos Checkpoint desde CheckpointDTOs."""
+        return [
+            Checkpoint(c.x, c.y, i)
+            for i, c in enumerate(checkpoint_data)
+        ]
     
     def _create_goal(self, goal_data):
         """Instancia el objeto Goal si existe en los datos."""
         if goal_data:
-            return Goal(goal_data['x'], goal_data['y'])
+            return Goal(goal_data.x, goal_data.y)
         return None
     
-    def _create_enemies(self, enemy_data):
+    def activate_entities(self, right_edge):
         """
-        Instancia contextos de enemigos.
-        Utiliza el patron Flyweight implicitamente al usar EnemyContext.
+        Instancia los enemigos y PowerUps pendientes cuya x queda antes de
+        right_edge (borde derecho de la camara mas un margen).
+        Utiliza el patron Flyweight implicitamente al usar EnemyContext y
+        PowerUpContext.
         """
-        enemies = []
-        for e in enemy_data:
-            enemy = EnemyContext(
-                e['x'], e['y'],
-                e.get('width', 40),
-                e.get('height', 50)
-            )
-            enemies.append(enemy)
-        return enemies
-    
-    def _create_powerups(self, powerup_data):
+        self._activate_pending(
+            self._pending_enemies, self._enemy_pool.acquire,
+            self.enemies, right_edge
+        )
+        self._activate_pending(
+            self._pending_powerups, self._powerup_pool.acquire,
+            self.powerups, right_edge
+        )
+    
+    @staticmethod
+    def _activate_pending(pending, acquire, active, right_edge):
+        """Mueve de pending a active las entradas con x < right_edge."""
+        # pending esta ordenada de mayor a menor x: el final es el mas cercano
+        while pending and pending[-1][0] < right_edge:
+            active.append(acquire(*pending.pop()))
+    
+    @staticmethod
+    def _sort_pending(entries):
+        """Ordena las tuplas normalizadas de mayor a menor x (pop = menor x)."""
+        entries.sort(key=itemgetter(0), reverse=True)
+        return entries
+    
+    @staticmethod
+    def _normalize_enemies(enemy_data):
         """
-        Instancia contextos de PowerUps.
-        Utiliza el patron Flyweight implicitamente al usar PowerUpContext.
+        Convierte los EnemyDTOs en tuplas (x, y, width, height) en una sola
+        pasada; los valores por defecto ya vienen resueltos por el generador.
         """
-        powerups = []
-        for p in powerup_data:
-            powerup_type = p.get('type', 'speed')
-            powerup = PowerUpContext(
-                p['x'], p['y'],
-                powerup_type,
-                p.get('width', 40),
-                p.get('height', 50)
-            )
-            powerups.append(powerup)
-        return powerups
+        return list(map(_BOX_FIELDS, enemy_data))
     
-    def get_platform_data(self):
-        """Retorna una lista simplificada de plataformas para calculos de fisica."""
+    @staticmethod
+    def _normalize_powerups(powerup_data):
+        """
+        Convierte los PowerUpDTOs en tuplas (x, y, type, width, height) en
+        una sola pasada; los valores por defecto ya vienen resueltos.
+        El tipo se interna: un texto construido en tiempo de ejecucion (no
+        literal) pasa a ser el mismo objeto que las claves literales de
+        PowerUpStrategyFactory.
+        """
+        intern = sys.intern
         return [
-            {
-                'x': p.x,
-                'y': p.y,
-                'width': p.width,
-                'height': p.height
-            }
-            for p in self.platforms
+            (x, y, intern(powerup_type), width, height)
+            for x, y, powerup_type, width, height
+            in map(_POWERUP_FIELDS, powerup_data)
         ]
+    
+    def get_platform_data(self):
+        """
+        Retorna los rectangulos de las plataformas para calculos de fisica.
+        Es una tupla memorizada en load_world: la misma en cada frame, y los
+        Rects que contiene no deben modificarse.
+        """
+        return self._platform_data_cache